@@ -1,4 +1,5 @@
 import asyncio
+import atexit
 from contextlib import asynccontextmanager
 
 import asyncpg
@@ -44,14 +45,30 @@ def delete_query(card_id: int) -> fos.Execute:
     return fos.Execute(t"DELETE FROM cards WHERE id = {card_id}")
 
 
+_pool: asyncpg.Pool | None = None
+
+
 @asynccontextmanager
 async def connect():
-    conn = await asyncpg.create_pool(DB_URL)
-    # conn = await psycopg.AsyncConnection.connect(DB_URL)  # for psycopg
-    try:
-        yield conn
-    finally:
-        await conn.close()
+    global _pool
+    if _pool is None:
+        _pool = await asyncpg.create_pool(DB_URL)
+        # _pool = await psycopg.AsyncConnection.connect(DB_URL)  # for psycopg
+    yield _pool
+
+
+runner = asyncio.Runner()
+
+
+def run(coro):
+    return runner.run(coro)
+
+
+@atexit.register
+def close():
+    if _pool is not None:
+        runner.run(_pool.close())
+    runner.close()
 
 
 @app.command()
@@ -63,7 +80,7 @@ def add(front: str, back: str):
             await add_query(front=front, back=back).execute(conn)
             print(f"  Added: {front} → {back}")
 
-    asyncio.run(_add())
+    run(_add())
 
 
 @app.command("list")
@@ -76,7 +93,7 @@ def list_cards():
             for card in cards:
                 print(f"  [{card.id}] {card.front} → {card.back}")
 
-    asyncio.run(_list_cards())
+    run(_list_cards())
 
 
 @app.command()
@@ -91,7 +108,7 @@ def find(text: str):
             else:
                 print(f"  No card found for '{text}'")
 
-    asyncio.run(_find())
+    run(_find())
 
 
 @app.command()
@@ -103,7 +120,7 @@ def delete(id: int):
             await delete_query(id).execute(conn)
             print(f"  Deleted: {id}")
 
-    asyncio.run(_delete())
+    run(_delete())
 
 
 @app.callback(invoke_without_command=True)
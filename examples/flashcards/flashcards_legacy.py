@@ -1,4 +1,5 @@
 import asyncio
+import atexit
 from contextlib import asynccontextmanager
 
 import asyncpg
@@ -50,13 +51,29 @@ def validate_all():
             console.print(f"  [green]✓[/green] {sql}")
 
 
+_pool: asyncpg.Pool | None = None
+
+
 @asynccontextmanager
 async def connect():
-    p = await asyncpg.create_pool(DB_URL)
-    try:
-        yield fear_of_sql.AsyncClient(p)
-    finally:
-        await p.close()
+    global _pool
+    if _pool is None:
+        _pool = await asyncpg.create_pool(DB_URL)
+    yield fear_of_sql.AsyncClient(_pool)
+
+
+runner = asyncio.Runner()
+
+
+def run(coro):
+    return runner.run(coro)
+
+
+@atexit.register
+def close():
+    if _pool is not None:
+        runner.run(_pool.close())
+    runner.close()
 
 
 @app.command()
@@ -69,7 +86,7 @@ def add(front: str, back: str):
             await client.execute(sql, front, back)
             print(f"  Added: {front} → {back}")
 
-    asyncio.run(_add())
+    run(_add())
 
 
 @app.command("list")
@@ -83,7 +100,7 @@ def list_cards():
             for card in cards:
                 print(f"  [{card.id}] {card.front} → {card.back}")
 
-    asyncio.run(_list_cards())
+    run(_list_cards())
 
 
 @app.command()
@@ -99,7 +116,7 @@ def find(text: str):
             else:
                 print(f"  No card found for '{text}'")
 
-    asyncio.run(_find())
+    run(_find())
 
 
 @app.command()
@@ -112,7 +129,7 @@ def delete(id: int):
             await client.execute(sql, id)
             print(f"  Deleted: {id}")
 
-    asyncio.run(_delete())
+    run(_delete())
 
 
 @app.callback(invoke_without_command=True)
@@ -2,13 +2,25 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, TypeVar
 
-from ._query import Execute, Query
+from ._errors import RowNotFoundError
+from ._query import (
+    _EXECUTOR_TYPES,
+    Query,
+    _async_executor,
+    _construct_result,
+    _construct_results,
+    _sql_and_args,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable, Sequence
+
     import asyncpg
     import psycopg
     import sqlalchemy.ext.asyncio
 
+    from ._executor import AsyncExecutor
+
 T = TypeVar("T")
 
 
@@ -22,20 +34,54 @@ class AsyncClient:
         | sqlalchemy.ext.asyncio.AsyncConnection,
     ) -> None:
         self._executor = executor
+        self._async_executor: AsyncExecutor | None = None
+
+    async def _exec(self) -> AsyncExecutor:
+        if self._async_executor is not None:
+            return self._async_executor
+        async_executor = await _async_executor(self._executor)
+        # SQLAlchemy sessions may hand out a different connection per
+        # transaction, so only driver executors are pinned.
+        if type(self._executor) in _EXECUTOR_TYPES:
+            self._async_executor = async_executor
+        return async_executor
 
     async def fetch_one(self, sql: str, result_type: type[T], *args: object) -> T:
-        return await Query(sql, result_type, *args).fetch_one(self._executor)
+        sql, args = _sql_and_args(sql, args)
+        row = await (await self._exec()).fetch_one(sql, args)
+        if row is None:
+            raise RowNotFoundError
+        return _construct_result(result_type, row)
 
     async def fetch_optional(
         self, sql: str, result_type: type[T], *args: object
     ) -> T | None:
-        return await Query(sql, result_type, *args).fetch_optional(self._executor)
+        sql, args = _sql_and_args(sql, args)
+        row = await (await self._exec()).fetch_one(sql, args)
+        if row is None:
+            return None
+        return _construct_result(result_type, row)
 
     async def fetch_all(self, sql: str, result_type: type[T], *args: object) -> list[T]:
-        return await Query(sql, result_type, *args).fetch_all(self._executor)
+        sql, args = _sql_and_args(sql, args)
+        rows = await (await self._exec()).fetch_all(sql, args)
+        return _construct_results(result_type, rows)
+
+    def fetch_iter(
+        self, sql: str, result_type: type[T], *args: object, prefetch: int = 1000
+    ) -> AsyncIterator[T]:
+        """Stream rows like Query.fetch_iter; close it when breaking early."""
+        return Query(sql, result_type, *args).fetch_iter(self._executor, prefetch)
 
     async def execute(self, sql: str, *args: object) -> None:
-        await Execute(sql, *args).execute(self._executor)
+        sql, args = _sql_and_args(sql, args)
+        await (await self._exec()).execute(sql, args)
 
     async def execute_rows(self, sql: str, *args: object) -> int:
-        return await Execute(sql, *args).execute_rows(self._executor)
+        sql, args = _sql_and_args(sql, args)
+        return await (await self._exec()).execute(sql, args)
+
+    async def execute_many(
+        self, sql: str, args: Iterable[Sequence[object]]
+    ) -> None:
+        await (await self._exec()).execute_many(sql, args)
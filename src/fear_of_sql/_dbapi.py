@@ -1,4 +1,4 @@
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from typing import Any, Protocol
 
 
@@ -16,6 +16,12 @@ class DBAPICursor(Protocol):
         parameters: Sequence[Any] | Mapping[str, Any] = ...,
         /,
     ) -> object: ...
+    def executemany(
+        self,
+        operation: str,
+        seq_of_parameters: Iterable[Sequence[Any]],
+        /,
+    ) -> object: ...
     def fetchone(self) -> Sequence[Any] | None: ...
     def fetchall(self) -> Sequence[Sequence[Any]]: ...
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Any
 
@@ -14,20 +15,6 @@ class UnresolvedColumn:
     name: str
     python_type: type
 
-    @classmethod
-    def from_pg(
-        cls,
-        name: str,
-        data: dict[str, Any],
-    ) -> UnresolvedColumn:
-        pg = PG_TYPES.get(data["type_oid"])
-        if pg is None:
-            raise UnsupportedTypeError(
-                type_oid=data["type_oid"],
-                column=name,
-            )
-        return cls(name=name, python_type=pg.python_type)
-
 
 @dataclass(frozen=True)
 class ColumnOrigin:
@@ -35,18 +22,6 @@ class ColumnOrigin:
     table_oid: int
     column_attrnum: int
 
-    @classmethod
-    def from_pg(
-        cls,
-        name: str,
-        data: dict[str, Any],
-    ) -> ColumnOrigin:
-        return cls(
-            name=name,
-            table_oid=data["table_oid"],
-            column_attrnum=data["column_attrnum"],
-        )
-
 
 @dataclass(frozen=True)
 class NullabilityOverride:
@@ -54,15 +29,17 @@ class NullabilityOverride:
     is_nullable: bool
 
 
+_OVERRIDE_SUFFIXES = {"!": False, "?": True}
+
+
 def _parse_column_name_nullability_override(
     column_info: dict[str, Any],
 ) -> tuple[str, bool | None]:
     raw_name = column_info["name"]
-    if raw_name.endswith("!"):
-        return raw_name[:-1], False
-    if raw_name.endswith("?"):
-        return raw_name[:-1], True
-    return raw_name, None
+    override = _OVERRIDE_SUFFIXES.get(raw_name[-1:])
+    if override is None:
+        return raw_name, None
+    return raw_name[:-1], override
 
 
 def describe(
@@ -79,13 +56,19 @@ def describe(
     if cols is None:
         return prepared_statement, [], [], []
 
+    pg_type = PG_TYPES.get
     unresolved = []
     origins = []
     overrides = []
     for col in cols:
         name, nullable_override = _parse_column_name_nullability_override(col)
-        unresolved.append(UnresolvedColumn.from_pg(name, col))
-        origins.append(ColumnOrigin.from_pg(name, col))
+        name = sys.intern(name)
+        type_oid = col["type_oid"]
+        pg = pg_type(type_oid)
+        if pg is None:
+            raise UnsupportedTypeError(type_oid=type_oid, column=name)
+        unresolved.append(UnresolvedColumn(name, pg.python_type))
+        origins.append(ColumnOrigin(name, col["table_oid"], col["column_attrnum"]))
         if nullable_override is not None:
             overrides.append(
                 NullabilityOverride(
@@ -1,35 +1,93 @@
-from collections.abc import Mapping, Sequence
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Mapping,
+    Sequence,
+)
 from typing import Any, Protocol
 
 import asyncpg
+from asyncpg.prepared_stmt import PreparedStatement
 
 
 class AsyncExecutor(Protocol):
     async def fetch_one(
-        self, sql: str, args: tuple[object, ...]
+        self, sql: str, args: tuple[object, ...], *, prepare: bool = True
     ) -> Mapping[str, Any] | None: ...
 
     async def fetch_all(
-        self, sql: str, args: tuple[object, ...]
+        self, sql: str, args: tuple[object, ...], *, prepare: bool = True
     ) -> Sequence[Mapping[str, Any]]: ...
 
     async def execute(self, sql: str, args: tuple[object, ...]) -> int: ...
 
+    async def execute_many(
+        self, sql: str, args: Iterable[Sequence[object]]
+    ) -> None: ...
+
+    def iterate(
+        self, sql: str, args: tuple[object, ...], prefetch: int
+    ) -> AsyncIterator[Mapping[str, Any]]: ...
+
 
 class AsyncpgExecutor:
     def __init__(self, executor: asyncpg.Pool | asyncpg.Connection) -> None:
         self._executor = executor
 
+    async def _run_unprepared(
+        self, sql: str, run: Callable[[PreparedStatement], Awaitable[Any]]
+    ) -> Any:
+        # A one-off statement is planned for its own parameters every time,
+        # so PostgreSQL never switches it over to a generic plan.
+        if isinstance(self._executor, asyncpg.Pool):
+            async with self._executor.acquire() as conn:
+                return await run(await conn.prepare(sql))
+        return await run(await self._executor.prepare(sql))
+
     async def fetch_one(
-        self, sql: str, args: tuple[object, ...]
+        self, sql: str, args: tuple[object, ...], *, prepare: bool = True
     ) -> Mapping[str, Any] | None:
+        if not prepare:
+            return await self._run_unprepared(  # type: ignore[no-any-return]
+                sql, lambda stmt: stmt.fetchrow(*args)
+            )
         return await self._executor.fetchrow(sql, *args)  # type: ignore[no-any-return]
 
     async def fetch_all(
-        self, sql: str, args: tuple[object, ...]
+        self, sql: str, args: tuple[object, ...], *, prepare: bool = True
     ) -> Sequence[Mapping[str, Any]]:
+        if not prepare:
+            return await self._run_unprepared(  # type: ignore[no-any-return]
+                sql, lambda stmt: stmt.fetch(*args)
+            )
         return await self._executor.fetch(sql, *args)  # type: ignore[no-any-return]
 
     async def execute(self, sql: str, args: tuple[object, ...]) -> int:
         result = await self._executor.execute(sql, *args)
-        return int(result.split()[-1])
+        return int(result[result.rfind(" ") + 1 :])
+
+    async def execute_many(
+        self, sql: str, args: Iterable[Sequence[object]]
+    ) -> None:
+        await self._executor.executemany(sql, args)
+
+    async def iterate(
+        self, sql: str, args: tuple[object, ...], prefetch: int
+    ) -> AsyncIterator[Mapping[str, Any]]:
+        if isinstance(self._executor, asyncpg.Pool):
+            async with self._executor.acquire() as conn:
+                async for record in _cursor(conn, sql, args, prefetch):
+                    yield record
+        else:
+            async for record in _cursor(self._executor, sql, args, prefetch):
+                yield record
+
+
+async def _cursor(
+    conn: asyncpg.Connection, sql: str, args: tuple[object, ...], prefetch: int
+) -> AsyncIterator[Mapping[str, Any]]:
+    async with conn.transaction():
+        async for record in conn.cursor(sql, *args, prefetch=prefetch):
+            yield record
@@ -16,10 +16,7 @@ class JoinType(str, Enum):
 
     @classmethod
     def from_raw(cls, value: str | None) -> JoinType | None:
-        try:
-            return cls(value) if value else None
-        except ValueError:
-            return None
+        return cls._value2member_map_.get(value) if value else None  # type: ignore[return-value]
 
 
 class ParentRelation(str, Enum):
@@ -31,10 +28,7 @@ class ParentRelation(str, Enum):
         cls,
         value: str | None,
     ) -> ParentRelation | None:
-        try:
-            return cls(value) if value else None
-        except ValueError:
-            return None
+        return cls._value2member_map_.get(value) if value else None  # type: ignore[return-value]
 
 
 @dataclass(frozen=True)
@@ -46,14 +40,26 @@ class PlanNode:
 
 
 def _parse_plan(raw: dict[str, Any]) -> PlanNode:
-    return PlanNode(
-        join_type=JoinType.from_raw(raw.get("Join Type")),
-        parent_relation=ParentRelation.from_raw(
-            raw.get("Parent Relationship"),
-        ),
-        output=raw.get("Output", []),
-        children=[_parse_plan(p) for p in raw.get("Plans", [])],
-    )
+    # Children are built before their parents, so walk the raw plans in
+    # pre-order and construct nodes in reverse.
+    order: list[dict[str, Any]] = []
+    stack = [raw]
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        stack.extend(node.get("Plans", []))
+
+    built: dict[int, PlanNode] = {}
+    for node in reversed(order):
+        built[id(node)] = PlanNode(
+            join_type=JoinType.from_raw(node.get("Join Type")),
+            parent_relation=ParentRelation.from_raw(
+                node.get("Parent Relationship"),
+            ),
+            output=node.get("Output", []),
+            children=[built[id(p)] for p in node.get("Plans", [])],
+        )
+    return built[id(raw)]
 
 
 def _visit_plan(
@@ -61,14 +67,24 @@ def _visit_plan(
     root_outputs: list[str],
     nullables: list[bool],
 ) -> None:
-    if plan.join_type == JoinType.FULL or plan.parent_relation == ParentRelation.INNER:
-        for col in plan.output:
-            if col in root_outputs:
-                nullables[root_outputs.index(col)] = True
-
-    if plan.join_type in (JoinType.LEFT, JoinType.RIGHT):
-        for child in plan.children:
-            _visit_plan(child, root_outputs, nullables)
+    output_index: dict[str, int] = {}
+    for i, col in enumerate(root_outputs):
+        output_index.setdefault(col, i)
+
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        if (
+            node.join_type == JoinType.FULL
+            or node.parent_relation == ParentRelation.INNER
+        ):
+            for col in node.output:
+                idx = output_index.get(col)
+                if idx is not None:
+                    nullables[idx] = True
+
+        if node.join_type in (JoinType.LEFT, JoinType.RIGHT):
+            stack.extend(node.children)
 
 
 def collect_explain_nullability(
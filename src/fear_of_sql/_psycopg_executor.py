@@ -1,4 +1,4 @@
-from collections.abc import Mapping, Sequence
+from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
 from typing import Any
 
 import psycopg
@@ -10,19 +10,33 @@ class PsycopgExecutor:
         self._executor = executor
 
     async def fetch_one(
-        self, sql: str, args: tuple[object, ...]
+        self, sql: str, args: tuple[object, ...], *, prepare: bool = True
     ) -> Mapping[str, Any] | None:
         cursor = self._executor.cursor(row_factory=dict_row)
-        await cursor.execute(sql, args or None)  # pyright: ignore[reportArgumentType]
+        await cursor.execute(sql, args or None, prepare=None if prepare else False)  # pyright: ignore[reportArgumentType]
         return await cursor.fetchone()
 
     async def fetch_all(
-        self, sql: str, args: tuple[object, ...]
+        self, sql: str, args: tuple[object, ...], *, prepare: bool = True
     ) -> Sequence[Mapping[str, Any]]:
         cursor = self._executor.cursor(row_factory=dict_row)
-        await cursor.execute(sql, args or None)  # pyright: ignore[reportArgumentType]
+        await cursor.execute(sql, args or None, prepare=None if prepare else False)  # pyright: ignore[reportArgumentType]
         return await cursor.fetchall()
 
     async def execute(self, sql: str, args: tuple[object, ...]) -> int:
         cursor = await self._executor.execute(sql, args or None)  # pyright: ignore[reportArgumentType]
         return cursor.rowcount
+
+    async def execute_many(
+        self, sql: str, args: Iterable[Sequence[object]]
+    ) -> None:
+        async with self._executor.cursor() as cursor:
+            await cursor.executemany(sql, args)
+
+    async def iterate(
+        self, sql: str, args: tuple[object, ...], prefetch: int  # noqa: ARG002
+    ) -> AsyncIterator[Mapping[str, Any]]:
+        # stream() fetches in single-row mode, so prefetch does not apply.
+        cursor = self._executor.cursor(row_factory=dict_row)
+        async for row in cursor.stream(sql, args or None):  # pyright: ignore[reportArgumentType]
+            yield row
@@ -1,45 +1,33 @@
 from __future__ import annotations
 
 import dataclasses
-from collections.abc import Mapping, Sequence
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
-
-import asyncpg
+import functools
+import operator
+import sys
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Hashable,
+    Mapping,
+    Sequence,
+)
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 
 from ._compat import Template, render
 from ._errors import RowNotFoundError
-from ._executor import AsyncExecutor, AsyncpgExecutor
 
-try:
+if TYPE_CHECKING:
+    import asyncpg
     import psycopg
-
-    from ._psycopg_executor import PsycopgExecutor
-
-    _PSYCOPG_TYPES: tuple[type, ...] = (psycopg.AsyncConnection,)
-except ImportError:  # pragma: no cover
-    PsycopgExecutor = None  # type: ignore[assignment,misc]
-    _PSYCOPG_TYPES = ()
-
-try:
     import sqlalchemy.ext.asyncio
 
-    _SA_ASYNC_SESSION_TYPES: tuple[type, ...] = (
-        sqlalchemy.ext.asyncio.AsyncSession,
-    )
-    _SA_ASYNC_CONN_TYPES: tuple[type, ...] = (
-        sqlalchemy.ext.asyncio.AsyncConnection,
-    )
-except ImportError:  # pragma: no cover
-    _SA_ASYNC_SESSION_TYPES = ()
-    _SA_ASYNC_CONN_TYPES = ()
-
-
-if TYPE_CHECKING:
     from ._dbapi import DBAPIConnection, DBAPICursor
+    from ._executor import AsyncExecutor
 
 
 T = TypeVar("T")
 
+
 def _execute_sync(
     conn: DBAPIConnection,
     sql: str,
@@ -50,6 +38,50 @@ def _execute_sync(
     return cursor
 
 
+_EXECUTOR_TYPES: dict[type, Callable[[Any], AsyncExecutor]] = {}
+
+
+# Drivers are never imported here: an executor of their type can only
+# exist once the application has imported them itself.
+def _register_loaded_drivers() -> None:
+    asyncpg = sys.modules.get("asyncpg")
+    if asyncpg is not None and asyncpg.Pool not in _EXECUTOR_TYPES:
+        from ._executor import AsyncpgExecutor  # noqa: PLC0415
+
+        _EXECUTOR_TYPES[asyncpg.Pool] = AsyncpgExecutor
+        _EXECUTOR_TYPES[asyncpg.Connection] = AsyncpgExecutor
+    psycopg = sys.modules.get("psycopg")
+    if psycopg is not None and psycopg.AsyncConnection not in _EXECUTOR_TYPES:
+        from ._psycopg_executor import PsycopgExecutor  # noqa: PLC0415
+
+        _EXECUTOR_TYPES[psycopg.AsyncConnection] = PsycopgExecutor
+
+
+async def _unwrap_sqlalchemy(executor: Any) -> Any:
+    sa_asyncio = sys.modules.get("sqlalchemy.ext.asyncio")
+    if sa_asyncio is None:  # pragma: no cover
+        return executor
+    if isinstance(executor, sa_asyncio.AsyncConnection):
+        pool_proxied = await executor.get_raw_connection()
+        return pool_proxied.driver_connection
+    if isinstance(executor, sa_asyncio.AsyncSession):
+        sa_connection = await executor.connection()
+        pool_proxied = await sa_connection.get_raw_connection()
+        return pool_proxied.driver_connection
+    return executor
+
+
+def _executor_factory(executor: object) -> Callable[[Any], AsyncExecutor] | None:
+    factory = _EXECUTOR_TYPES.get(type(executor))
+    if factory is not None:
+        return factory
+    for cls, factory in list(_EXECUTOR_TYPES.items()):
+        if isinstance(executor, cls):
+            _EXECUTOR_TYPES[type(executor)] = factory
+            return factory
+    return None
+
+
 async def _async_executor(
     executor: asyncpg.Pool
     | asyncpg.Connection
@@ -57,25 +89,23 @@ async def _async_executor(
     | sqlalchemy.ext.asyncio.AsyncSession
     | sqlalchemy.ext.asyncio.AsyncConnection,
 ) -> AsyncExecutor:
-    raw_executor: Any = executor
+    factory = _EXECUTOR_TYPES.get(type(executor))
+    if factory is not None:
+        return factory(executor)
 
-    if isinstance(executor, _SA_ASYNC_CONN_TYPES):
-        pool_proxied = await executor.get_raw_connection()  # type: ignore[attr-defined]
-        raw_executor = pool_proxied.driver_connection
-    elif isinstance(executor, _SA_ASYNC_SESSION_TYPES):
-        sa_connection = await executor.connection()  # type: ignore[attr-defined]
-        pool_proxied = await sa_connection.get_raw_connection()
-        raw_executor = pool_proxied.driver_connection
-
-    if isinstance(raw_executor, (asyncpg.Connection, asyncpg.Pool)):
-        return AsyncpgExecutor(raw_executor)
-    if PsycopgExecutor is not None and isinstance(raw_executor, _PSYCOPG_TYPES):
-        return PsycopgExecutor(raw_executor)  # type: ignore[arg-type]
+    _register_loaded_drivers()
+    raw_executor = await _unwrap_sqlalchemy(executor)
+    factory = _executor_factory(raw_executor)
+    if factory is not None:
+        return factory(raw_executor)
 
     msg = f"unsupported executor type: {type(raw_executor).__name__}"
     raise TypeError(msg)
 
 
+_COL0 = operator.itemgetter(0)
+
+
 def _strip_override(name: str) -> str:
     return name[:-1] if name.endswith(("!", "?")) else name
 
@@ -84,25 +114,109 @@ def _col_names(cursor: DBAPICursor) -> list[str]:
     if cursor.description is None:  # pragma: no cover
         msg = "query returned no description"
         raise RuntimeError(msg)
-    return [_strip_override(desc[0]) for desc in cursor.description]
+    return list(map(_strip_override, map(_COL0, cursor.description)))
 
 
-def _construct_result(result_type: type[T], row: Mapping[str, Any]) -> T:
-    if dataclasses.is_dataclass(result_type) or hasattr(
+def _is_model(result_type: Any) -> bool:
+    return dataclasses.is_dataclass(result_type) or hasattr(
         result_type, "model_fields"
-    ):
-        return result_type(**{_strip_override(k): v for k, v in row.items()})
-    return next(iter(row.values()))  # type: ignore[no-any-return]
+    )
+
+
+def _is_plain_dataclass(result_type: Any) -> bool:
+    return dataclasses.is_dataclass(result_type) and not hasattr(
+        result_type, "__pydantic_fields__"
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _mapping_constructor(
+    result_type: Any, keys: tuple[str, ...]
+) -> Callable[[Mapping[str, Any]], Any]:
+    if not _is_model(result_type):
+        return operator.itemgetter(keys[0])
+    names = tuple(_strip_override(k) for k in keys)
+    if _is_plain_dataclass(result_type):
+        compiled = _compile_dataclass_constructor(
+            result_type, names, from_mapping=True
+        )
+        if compiled is not None:
+            return compiled
+    if names == keys:
+        return lambda row: result_type(**row)
+    return lambda row: result_type(**dict(zip(names, row.values(), strict=True)))
+
+
+def _compile_dataclass_constructor(
+    result_type: Any, cols: tuple[str, ...], *, from_mapping: bool = False
+) -> Callable[[Any], Any] | None:
+    init_names = [f.name for f in dataclasses.fields(result_type) if f.init]
+    if sorted(cols) != sorted(init_names):
+        return None
+    # Mapping rows are unpacked into locals once; sequences are indexed.
+    values = [f"_{i}" if from_mapping else f"row[{i}]" for i in range(len(cols))]
+    # Keywords, not positions: __init__ may be hand-written with its own
+    # parameter order.
+    call_args = [
+        f"{col}={value}" for col, value in zip(cols, values, strict=True)
+    ]
+    body = f"return T({', '.join(call_args)})"
+    if from_mapping:
+        body = f"[{', '.join(values)}] = row.values(); {body}"
+    namespace: dict[str, Any] = {}
+    exec(  # noqa: S102
+        f"def build(row): {body}",
+        {"T": result_type},
+        namespace,
+    )
+    return namespace["build"]  # type: ignore[no-any-return]
+
+
+@functools.lru_cache(maxsize=256)
+def _row_constructor(
+    result_type: Any, cols: tuple[str, ...]
+) -> Callable[[Sequence[Any]], Any]:
+    if not _is_model(result_type):
+        return operator.itemgetter(0)
+    if _is_plain_dataclass(result_type):
+        compiled = _compile_dataclass_constructor(result_type, cols)
+        if compiled is not None:
+            return compiled
+    return lambda row: result_type(**dict(zip(cols, row, strict=True)))
+
+
+def _construct_result(result_type: type[T], row: Mapping[str, Any]) -> T:
+    ctor = _mapping_constructor(
+        cast("Hashable", result_type), tuple(row.keys())
+    )
+    return ctor(row)  # type: ignore[no-any-return]
+
+
+def _construct_results(
+    result_type: type[T], rows: Sequence[Mapping[str, Any]]
+) -> list[T]:
+    if not rows:
+        return []
+    ctor = _mapping_constructor(
+        cast("Hashable", result_type), tuple(rows[0].keys())
+    )
+    return list(map(ctor, rows))
 
 
 def _construct_dbapi_result(
     result_type: type[T], cols: list[str], row: Sequence[Any]
 ) -> T:
-    if dataclasses.is_dataclass(result_type) or hasattr(
-        result_type, "model_fields"
-    ):
-        return result_type(**dict(zip(cols, row, strict=True)))
-    return row[0]  # type: ignore[no-any-return]
+    ctor = _row_constructor(cast("Hashable", result_type), tuple(cols))
+    return ctor(row)  # type: ignore[no-any-return]
+
+
+def _sql_and_args(
+    sql: Template | str, args: tuple[object, ...]
+) -> tuple[str, tuple[object, ...]]:
+    if isinstance(sql, Template):
+        rendered = render(sql)
+        return rendered.sql, rendered.params
+    return sql, args
 
 
 class BaseQuery:
@@ -112,21 +226,18 @@ class BaseQuery:
 
 class Query(BaseQuery, Generic[T]):
     result_type: type[T]
+    prepare: bool
 
     def __init__(
         self,
         sql: Template | str,
         result_type: type[T],
         *args: object,
+        prepare: bool = True,
     ) -> None:
-        if isinstance(sql, Template):
-            rendered = render(sql)
-            self.sql = rendered.sql
-            self.args = rendered.params
-        else:
-            self.sql = sql
-            self.args = args
+        self.sql, self.args = _sql_and_args(sql, args)
         self.result_type = result_type
+        self.prepare = prepare
 
     async def fetch_one(
         self,
@@ -137,7 +248,9 @@ class Query(BaseQuery, Generic[T]):
         | sqlalchemy.ext.asyncio.AsyncConnection,
     ) -> T:
         async_executor = await _async_executor(executor)
-        row = await async_executor.fetch_one(self.sql, self.args)
+        row = await async_executor.fetch_one(
+            self.sql, self.args, prepare=self.prepare
+        )
         if row is None:
             raise RowNotFoundError
         return _construct_result(self.result_type, row)
@@ -151,7 +264,9 @@ class Query(BaseQuery, Generic[T]):
         | sqlalchemy.ext.asyncio.AsyncConnection,
     ) -> T | None:
         async_executor = await _async_executor(executor)
-        row = await async_executor.fetch_one(self.sql, self.args)
+        row = await async_executor.fetch_one(
+            self.sql, self.args, prepare=self.prepare
+        )
         if row is None:
             return None
         return _construct_result(self.result_type, row)
@@ -165,8 +280,35 @@ class Query(BaseQuery, Generic[T]):
         | sqlalchemy.ext.asyncio.AsyncConnection,
     ) -> list[T]:
         async_executor = await _async_executor(executor)
-        rows = await async_executor.fetch_all(self.sql, self.args)
-        return [_construct_result(self.result_type, row) for row in rows]
+        rows = await async_executor.fetch_all(
+            self.sql, self.args, prepare=self.prepare
+        )
+        return _construct_results(self.result_type, rows)
+
+    async def fetch_iter(
+        self,
+        executor: asyncpg.Pool
+        | asyncpg.Connection
+        | psycopg.AsyncConnection
+        | sqlalchemy.ext.asyncio.AsyncSession
+        | sqlalchemy.ext.asyncio.AsyncConnection,
+        prefetch: int = 1000,
+    ) -> AsyncIterator[T]:
+        """Stream rows through a server-side cursor.
+
+        The cursor's transaction, and for pools its connection, are held
+        until the iterator is exhausted or closed; wrap it in
+        contextlib.aclosing() when breaking out early. prefetch only
+        applies to asyncpg; psycopg streams rows one at a time.
+        """
+        async_executor = await _async_executor(executor)
+        ctor = None
+        async for row in async_executor.iterate(self.sql, self.args, prefetch):
+            if ctor is None:
+                ctor = _mapping_constructor(
+                    cast("Hashable", self.result_type), tuple(row.keys())
+                )
+            yield ctor(row)
 
     def fetch_one_sync(self, conn: DBAPIConnection) -> T:
         cursor = _execute_sync(conn, str(self.sql), self.args)
@@ -188,11 +330,10 @@ class Query(BaseQuery, Generic[T]):
 
     def fetch_all_sync(self, conn: DBAPIConnection) -> list[T]:
         cursor = _execute_sync(conn, str(self.sql), self.args)
-        cols = _col_names(cursor)
-        return [
-            _construct_dbapi_result(self.result_type, cols, row)
-            for row in cursor.fetchall()
-        ]
+        ctor = _row_constructor(
+            cast("Hashable", self.result_type), tuple(_col_names(cursor))
+        )
+        return list(map(ctor, cursor.fetchall()))
 
 
 class Execute(BaseQuery):
@@ -201,13 +342,7 @@ class Execute(BaseQuery):
         sql: Template | str,
         *args: object,
     ) -> None:
-        if isinstance(sql, Template):
-            rendered = render(sql)
-            self.sql = rendered.sql
-            self.args = rendered.params
-        else:
-            self.sql = sql
-            self.args = args
+        self.sql, self.args = _sql_and_args(sql, args)
 
     async def execute(
         self,
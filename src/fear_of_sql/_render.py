@@ -1,20 +1,29 @@
 from __future__ import annotations
 
+import functools
 from string.templatelib import Template
 from typing import NamedTuple
 
+_PLACEHOLDERS: list[str] = [f"${i}" for i in range(1, 65)]
+
 
 class RenderedQuery(NamedTuple):
     sql: str
     params: tuple[object, ...]
 
 
+@functools.lru_cache(maxsize=1024)
+def _render_sql(strings: tuple[str, ...]) -> str:
+    n = len(strings) - 1
+    parts: list[str] = [""] * (2 * n + 1)
+    parts[0::2] = strings
+    if n <= len(_PLACEHOLDERS):
+        parts[1::2] = _PLACEHOLDERS[:n]
+    else:
+        parts[1::2] = [f"${i + 1}" for i in range(n)]
+    return "".join(parts)
+
+
 def render(template: Template) -> RenderedQuery:
-    parts: list[str] = []
-    params: list[object] = []
-    for i, s in enumerate(template.strings):
-        parts.append(s)
-        if i < len(template.interpolations):
-            parts.append(f"${i + 1}")
-            params.append(template.interpolations[i].value)
-    return RenderedQuery("".join(parts), tuple(params))
+    params = tuple(i.value for i in template.interpolations)
+    return RenderedQuery(_render_sql(template.strings), params)
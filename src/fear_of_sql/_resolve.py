@@ -1,5 +1,8 @@
-import types
+import functools
+import re
+import typing
 from dataclasses import dataclass, fields, is_dataclass
+from types import UnionType
 from typing import Any
 
 import pg8000.native
@@ -11,43 +14,63 @@ from ._describe import (
 )
 from ._errors import (
     ColumnCountMismatchError,
-    ColumnNotFoundError,
     NullabilityError,
     TypeMismatchError,
     ValidationError,
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResolvedColumn:
     name: str
     mapped_type: type
     nullable: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Nullable:
     name: str
     nullable: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExpectedColumn:
     name: str
-    allowed_types: list[type]
+    allowed_types: tuple[type, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExpectedScalar:
-    allowed_types: list[type]
+    allowed_types: tuple[type, ...]
 
 
 def collect_catalog_nullability(
     conn: pg8000.native.Connection,
     origins: list[ColumnOrigin],
+    not_null: dict[tuple[int, int], bool],
 ) -> list[Nullable]:
-    nullability_info = []
+    keys = {
+        (origin.table_oid, origin.column_attrnum)
+        for origin in origins
+        if origin.table_oid != 0
+    }
+    keys.difference_update(not_null)
+    if keys:
+        oids, nums = zip(*keys, strict=True)
+        rows = conn.run(
+            "SELECT t.oid, t.num, a.attnotnull "
+            "FROM unnest(CAST(:oids AS oid[]), CAST(:nums AS int2[]))"
+            " AS t(oid, num) "
+            "JOIN pg_catalog.pg_attribute a"
+            " ON a.attrelid = t.oid AND a.attnum = t.num",
+            oids=list(oids),
+            nums=list(nums),
+        )
+        not_null.update(
+            ((oid, num), attnotnull) for oid, num, attnotnull in rows
+        )
 
+    nullability_info = []
     for origin in origins:
         if origin.table_oid == 0:
             nullability_info.append(
@@ -55,13 +78,8 @@ def collect_catalog_nullability(
             )
             continue
 
-        result = conn.run(
-            "SELECT attnotnull FROM pg_catalog.pg_attribute "
-            "WHERE attrelid = :oid AND attnum = :num",
-            oid=origin.table_oid,
-            num=origin.column_attrnum,
-        )
-        if not result:  # pragma: no cover
+        key = (origin.table_oid, origin.column_attrnum)
+        if key not in not_null:  # pragma: no cover
             msg = (
                 f"pg_attribute row not found for"
                 f" OID {origin.table_oid},"
@@ -71,36 +89,54 @@ def collect_catalog_nullability(
         nullability_info.append(
             Nullable(
                 name=origin.name,
-                nullable=not result[0][0],
+                nullable=not not_null[key],
             )
         )
     return nullability_info
 
 
+def _unwrap_types(t: Any) -> tuple[type, ...]:
+    return t.__args__ if isinstance(t, UnionType) else (t,)
+
+
+def _dataclass_hints(result_type: Any) -> dict[str, Any]:
+    try:
+        return typing.get_type_hints(result_type)
+    except NameError as e:
+        # Falling back to the raw strings would silently fail every check.
+        field = next(
+            (
+                f.name
+                for f in fields(result_type)
+                if re.search(rf"\b{re.escape(str(e.name))}\b", str(f.type))
+            ),
+            None,
+        )
+        msg = f"{result_type.__name__}.{field}: cannot resolve annotation: {e}"
+        raise TypeError(msg) from e
+
+
+@functools.lru_cache(maxsize=1024)
 def extract_expected(
     result_type: Any,
-) -> ExpectedScalar | list[ExpectedColumn]:
-    def _unwrap_types(t: Any) -> list[type]:
-        if isinstance(t, types.UnionType):
-            return list(t.__args__)
-        return [t]
-
+) -> ExpectedScalar | tuple[ExpectedColumn, ...]:
     if is_dataclass(result_type):
-        return [
+        hints = _dataclass_hints(result_type)
+        return tuple(
             ExpectedColumn(
                 name=field.name,
-                allowed_types=_unwrap_types(field.type),
+                allowed_types=_unwrap_types(hints.get(field.name, field.type)),
             )
             for field in fields(result_type)
-        ]
+        )
     if hasattr(result_type, "model_fields"):
-        return [
+        return tuple(
             ExpectedColumn(
                 name=name,
                 allowed_types=_unwrap_types(field.annotation),
             )
             for name, field in result_type.model_fields.items()
-        ]
+        )
     return ExpectedScalar(
         allowed_types=_unwrap_types(result_type),
     )
@@ -108,14 +144,14 @@ def extract_expected(
 
 def check_column(
     col: ResolvedColumn,
-    allowed_types: list[type],
+    allowed_types: tuple[type, ...],
 ) -> list[ValidationError]:
     errors: list[ValidationError] = []
     if col.mapped_type not in allowed_types:
         errors.append(
             TypeMismatchError(
                 column=col.name,
-                expected=allowed_types,
+                expected=list(allowed_types),
                 actual=col.mapped_type,
             )
         )
@@ -131,10 +167,8 @@ def resolve(
     query_overrides: list[NullabilityOverride],
 ) -> list[ResolvedColumn]:
     null_map = {n.name: n.nullable for n in catalog_nullability}
-    for override in explain_overrides:
-        null_map[override.name] = override.is_nullable
-    for override in query_overrides:
-        null_map[override.name] = override.is_nullable
+    null_map.update((o.name, o.is_nullable) for o in explain_overrides)
+    null_map.update((o.name, o.is_nullable) for o in query_overrides)
 
     return [
         ResolvedColumn(
@@ -158,13 +192,3 @@ def check_scalar(
             )
         ]
     return check_column(resolved[0], expected.allowed_types)
-
-
-def find_column(
-    resolved: list[ResolvedColumn],
-    name: str,
-) -> ResolvedColumn | ColumnNotFoundError:
-    for col in resolved:
-        if col.name == name:
-            return col
-    return ColumnNotFoundError(column=name)
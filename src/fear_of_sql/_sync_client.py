@@ -1,3 +1,4 @@
+from collections.abc import Iterable, Sequence
 from typing import TypeVar
 
 from ._dbapi import DBAPIConnection
@@ -24,3 +25,6 @@ class SyncClient:
 
     def execute_rows(self, sql: str, *args: object) -> int:
         return Execute(sql, *args).execute_rows_sync(self._conn)
+
+    def execute_many(self, sql: str, args: Iterable[Sequence[object]]) -> None:
+        self._conn.cursor().executemany(sql, args)
@@ -4,7 +4,7 @@ import uuid
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PgType:
     name: str
     python_type: type
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
 import datetime
+import functools
+import hashlib
+import importlib.metadata
 import inspect
+import json
 import logging
+import pathlib
+import queue
+import re
 import types
 import typing
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from typing import NamedTuple, ParamSpec, TypeVar
+from typing import Any, NamedTuple, ParamSpec, TypeVar
 
 import pg8000.dbapi
 import pg8000.native
@@ -28,7 +36,6 @@ from ._resolve import (
     check_scalar,
     collect_catalog_nullability,
     extract_expected,
-    find_column,
     resolve,
 )
 
@@ -38,6 +45,19 @@ T = TypeVar("T", bound=BaseQuery)
 P = ParamSpec("P")
 
 
+_WS_RE = re.compile(r"\s+")
+
+
+class _OneLine:
+    __slots__ = ("sql",)
+
+    def __init__(self, sql: str) -> None:
+        self.sql = sql
+
+    def __str__(self) -> str:
+        return _WS_RE.sub(" ", self.sql).strip()
+
+
 class DummyArg(NamedTuple):
     param_name: str
     value: object
@@ -60,7 +80,29 @@ _DUMMY_VALUES: dict[type, object] = {
 }
 
 
-def _make_dummy_args(fn: Callable[..., BaseQuery]) -> list[DummyArg]:
+_NO_DUMMY = object()
+
+
+def _dummy_value(annotation: Any) -> object:
+    args = typing.get_args(annotation)
+    if type(None) in args:
+        return None
+    if annotation in _DUMMY_VALUES:
+        return _DUMMY_VALUES[annotation]
+    origin = typing.get_origin(annotation)
+    if origin is types.UnionType or origin is typing.Union:
+        for arg in args:
+            value = _dummy_value(arg)
+            if value is not _NO_DUMMY:
+                return value
+        return _NO_DUMMY
+    if isinstance(origin, type) and origin in _DUMMY_VALUES:
+        return _DUMMY_VALUES[origin]
+    return _NO_DUMMY
+
+
+@functools.cache
+def _make_dummy_args(fn: Callable[..., BaseQuery]) -> tuple[DummyArg, ...]:
     sig = inspect.signature(fn)
     annotations = inspect.get_annotations(fn, eval_str=True)
     result: list[DummyArg] = []
@@ -69,79 +111,254 @@ def _make_dummy_args(fn: Callable[..., BaseQuery]) -> list[DummyArg]:
             msg = f"{fn.__name__}: parameter {param_name!r} has no type annotation"
             raise TypeError(msg)
         annotation = annotations[param_name]
-        args = typing.get_args(annotation)
-        if type(None) in args:
-            result.append(DummyArg(param_name, None))
-            continue
-        if annotation in _DUMMY_VALUES:
-            dummy_value = _DUMMY_VALUES[annotation]
-            result.append(DummyArg(param_name, dummy_value))
-            continue
-        origin = typing.get_origin(annotation)
-        if isinstance(origin, type) and origin in _DUMMY_VALUES:
-            origin_dummy_value = _DUMMY_VALUES[origin]
-            result.append(DummyArg(param_name, origin_dummy_value))
-            continue
-        msg = f"{fn.__name__}: no dummy value for type {annotation!r} on parameter {param_name!r}"
-        raise TypeError(msg)
-    return result
+        dummy_value = _dummy_value(annotation)
+        if dummy_value is _NO_DUMMY:
+            msg = f"{fn.__name__}: no dummy value for type {annotation!r} on parameter {param_name!r}"
+            raise TypeError(msg)
+        result.append(DummyArg(param_name, dummy_value))
+    return tuple(result)
+
+
+# Everything a validated query depends on in the catalog: user relation
+# columns, view definitions and function signatures. Any change
+# invalidates the whole validation cache.
+_SCHEMA_FINGERPRINT_SQL = """
+SELECT md5(
+    coalesce((
+        SELECT string_agg(
+            concat_ws(':', a.attrelid, a.attnum, a.attname, a.atttypid, a.attnotnull),
+            ',' ORDER BY a.attrelid, a.attnum
+        )
+        FROM pg_catalog.pg_attribute a
+        JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname NOT IN ('pg_catalog', 'information_schema')
+          AND c.relkind IN ('r', 'v', 'm', 'p', 'f')
+          AND a.attnum > 0
+          AND NOT a.attisdropped
+    ), '')
+    || coalesce((
+        SELECT string_agg(definition, ',' ORDER BY schemaname, viewname)
+        FROM pg_catalog.pg_views
+        WHERE schemaname NOT IN ('pg_catalog', 'information_schema')
+    ), '')
+    || coalesce((
+        SELECT string_agg(
+            concat_ws(':', p.oid, p.proname, p.prorettype, p.proargtypes, p.proretset),
+            ',' ORDER BY p.oid
+        )
+        FROM pg_catalog.pg_proc p
+        JOIN pg_catalog.pg_namespace n ON n.oid = p.pronamespace
+        WHERE n.nspname NOT IN ('pg_catalog', 'information_schema')
+    ), '')
+)
+"""
+
+
+def _validation_key(sql: str, result_type: type | types.UnionType | None) -> str:
+    expected = None if result_type is None else extract_expected(result_type)
+    return hashlib.sha256(f"{sql}\0{expected!r}".encode()).hexdigest()
+
+
+def _schema_token(conn: pg8000.native.Connection) -> str:
+    # A library upgrade may change what is checked, so it invalidates too.
+    [[fingerprint]] = conn.run(_SCHEMA_FINGERPRINT_SQL)
+    return f"{importlib.metadata.version('fear-of-sql')}:{fingerprint}"
+
+
+def _read_validation_cache(path: pathlib.Path, schema: str) -> set[str]:
+    # Anything unreadable or malformed is treated as an empty cache.
+    try:
+        data = json.loads(path.read_text())
+        validated = set(data["validated"]) if data["schema"] == schema else set()
+    except (OSError, ValueError, TypeError, KeyError):
+        return set()
+    return validated
 
 
 class FearOfSQL:
-    def __init__(self) -> None:
+    def __init__(self, cache_path: str | pathlib.Path | None = None) -> None:
         self._queries: list[Callable[..., BaseQuery]] = []
+        self._connections: dict[str, pg8000.native.Connection] = {}
+        self._cache_path = None if cache_path is None else pathlib.Path(cache_path)
 
     def query(self, fn: Callable[P, T]) -> Callable[P, T]:
         self._queries.append(fn)
         return fn
 
     def validate_all(
-        self, conn: pg8000.native.Connection | str,
+        self,
+        conn: pg8000.native.Connection | str,
+        *,
+        reuse: bool = False,
+        max_workers: int = 1,
     ) -> int:
+        if reuse and not isinstance(conn, str):
+            msg = "reuse needs a connection URL"
+            raise TypeError(msg)
+        if max_workers > 1 and not isinstance(conn, str):
+            msg = "max_workers > 1 needs a connection URL"
+            raise TypeError(msg)
+        if isinstance(conn, str) and reuse:
+            return self._validate_reused(conn, max_workers)
         if isinstance(conn, str):
             native_conn = _connect_from_url(conn)
             try:
-                return self._validate(native_conn)
+                return self._validate(native_conn, conn, max_workers)
             finally:
                 native_conn.close()
         return self._validate(conn)
 
-    def _validate(self, conn: pg8000.native.Connection) -> int:
-        count = 0
-        for fn in self._queries:
-            kwargs = {arg.param_name: arg.value for arg in _make_dummy_args(fn)}
-            query_obj = fn(**kwargs)
-            sql_oneline = " ".join(str(query_obj.sql).split())
-            result_type = (
-                query_obj.result_type if isinstance(query_obj, Query) else None
+    def close_connections(self) -> None:
+        while self._connections:
+            _, conn = self._connections.popitem()
+            conn.close()
+
+    def _validate_reused(self, url: str, max_workers: int) -> int:
+        conn = self._connections.get(url)
+        if conn is None:
+            conn = self._connections[url] = _connect_from_url(url)
+        try:
+            return self._validate(conn, url, max_workers)
+        except pg8000.native.InterfaceError:  # pragma: no cover
+            # The connection is gone; reconnect on the next call.
+            del self._connections[url]
+            raise
+
+    def _validate(
+        self,
+        conn: pg8000.native.Connection,
+        url: str | None = None,
+        max_workers: int = 1,
+    ) -> int:
+        if self._cache_path is None:
+            return self._validate_queries(conn, None, url, max_workers)
+        schema = _schema_token(conn)
+        validated = _read_validation_cache(self._cache_path, schema)
+        try:
+            return self._validate_queries(conn, validated, url, max_workers)
+        finally:
+            self._cache_path.write_text(
+                json.dumps({"schema": schema, "validated": sorted(validated)})
             )
-            for error in collect_errors(conn, query_obj.sql, result_type):
-                logger.warning(
-                    "ERR: %s — %s — %s",
-                    fn.__name__,
-                    error,
-                    sql_oneline,
-                )
-                error.query_name = fn.__name__
-                error.sql = str(query_obj.sql)
-                raise error
-            logger.info(
-                "ok: %s — %s",
+
+    def _validate_queries(
+        self,
+        conn: pg8000.native.Connection,
+        validated: set[str] | None,
+        url: str | None,
+        max_workers: int,
+    ) -> int:
+        workers = min(max_workers, len(self._queries))
+        if url is None or workers <= 1:
+            # Column nullability is shared by every query of a single pass.
+            catalog_cache: dict[tuple[int, int], bool] = {}
+            return _report(
+                _check(conn, fn, validated, catalog_cache) for fn in self._queries
+            )
+
+        idle: queue.SimpleQueue[
+            tuple[pg8000.native.Connection, dict[tuple[int, int], bool]]
+        ] = queue.SimpleQueue()
+        idle.put((conn, {}))
+
+        def check(fn: Callable[..., BaseQuery]) -> _Checked:
+            worker_conn, worker_cache = idle.get()
+            try:
+                return _check(worker_conn, fn, validated, worker_cache)
+            finally:
+                idle.put((worker_conn, worker_cache))
+
+        extra: list[pg8000.native.Connection] = []
+        try:
+            for _ in range(workers - 1):
+                worker_conn = _connect_from_url(url)
+                extra.append(worker_conn)
+                idle.put((worker_conn, {}))
+            with ThreadPoolExecutor(workers) as pool:
+                # map() yields in registration order, so logs and the first
+                # raised error match a serial run.
+                return _report(pool.map(check, self._queries))
+        finally:
+            for worker_conn in extra:
+                worker_conn.close()
+
+
+class _Checked(NamedTuple):
+    fn: Callable[..., BaseQuery]
+    query: BaseQuery
+    errors: list[ValidationError]
+
+
+def _check(
+    conn: pg8000.native.Connection,
+    fn: Callable[..., BaseQuery],
+    validated: set[str] | None,
+    catalog_cache: dict[tuple[int, int], bool],
+) -> _Checked:
+    kwargs = {arg.param_name: arg.value for arg in _make_dummy_args(fn)}
+    query_obj = fn(**kwargs)
+    result_type = query_obj.result_type if isinstance(query_obj, Query) else None
+    if validated is None:
+        errors = _collect_errors(conn, query_obj.sql, result_type, catalog_cache)
+        return _Checked(fn, query_obj, errors)
+    key = _validation_key(str(query_obj.sql), result_type)
+    if key in validated:
+        return _Checked(fn, query_obj, [])
+    errors = _collect_errors(conn, query_obj.sql, result_type, catalog_cache)
+    if not errors:
+        validated.add(key)
+    return _Checked(fn, query_obj, errors)
+
+
+def _report(results: Iterable[_Checked]) -> int:
+    count = 0
+    for fn, query_obj, errors in results:
+        sql_oneline = _OneLine(str(query_obj.sql))
+        for error in errors:
+            logger.warning(
+                "ERR: %s — %s — %s",
                 fn.__name__,
+                error,
                 sql_oneline,
             )
-            count += 1
-        return count
+            error.query_name = fn.__name__
+            error.sql = str(query_obj.sql)
+            raise error
+        logger.info(
+            "ok: %s — %s",
+            fn.__name__,
+            sql_oneline,
+        )
+        count += 1
+    return count
+
+
+@functools.lru_cache(maxsize=1024)
+def _convert_paramstyle(sql: str) -> str:
+    converted_sql: str
+    converted_sql, _ = pg8000.dbapi.convert_paramstyle("format", sql, ())
+    return converted_sql
 
 
 def collect_errors(
     conn: pg8000.native.Connection,
     sql: Template | str,
     result_type: type | types.UnionType | None = None,
+) -> list[ValidationError]:
+    return _collect_errors(conn, sql, result_type, {})
+
+
+def _collect_errors(
+    conn: pg8000.native.Connection,
+    sql: Template | str,
+    result_type: type | types.UnionType | None,
+    catalog_cache: dict[tuple[int, int], bool],
 ) -> list[ValidationError]:
     sql_str = render(sql).sql if isinstance(sql, Template) else sql
-    converted_sql, _ = pg8000.dbapi.convert_paramstyle("format", sql_str, ())
-    prepared_stmt, unresolved, origins, query_overrides = describe(conn, converted_sql)
+    prepared_stmt, unresolved, origins, query_overrides = describe(
+        conn, _convert_paramstyle(sql_str)
+    )
     if result_type is None:
         prepared_stmt.close()
         return []
@@ -149,6 +366,7 @@ def collect_errors(
         catalog_nullability = collect_catalog_nullability(
             conn,
             origins,
+            catalog_cache,
         )
         explain_nullability = collect_explain_nullability(
             conn,
@@ -168,11 +386,12 @@ def collect_errors(
     if isinstance(expected, ExpectedScalar):
         return check_scalar(resolved, expected)
 
+    by_name = {col.name: col for col in resolved}
     errors: list[ValidationError] = []
     for exp in expected:
-        match find_column(resolved, exp.name):
-            case ColumnNotFoundError() as err:
-                errors.append(err)
-            case col:
-                errors.extend(check_column(col, exp.allowed_types))
+        col = by_name.get(exp.name)
+        if col is None:
+            errors.append(ColumnNotFoundError(column=exp.name))
+        else:
+            errors.extend(check_column(col, exp.allowed_types))
     return errors
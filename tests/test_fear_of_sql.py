@@ -1,10 +1,16 @@
+import asyncio
 import datetime
+import json
 import logging
+import subprocess
+import sys
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
+from importlib.metadata import version
 from typing import Generic, TypeVar
 
+import asyncpg
 import pg8000
 import pytest
 from conftest import DB_URL
@@ -26,6 +32,7 @@ from fear_of_sql import (
     ValidationError,
     collect_errors,
 )
+from fear_of_sql._connect import _connect_from_url
 
 
 @dataclass
@@ -557,6 +564,17 @@ def test_type_mapping(conn, sql, expected_type):
     assert not collect_errors(conn, sql, expected_type)
 
 
+def test_validation_sees_schema_changes(conn):
+    conn.run("CREATE TABLE schema_change (val int NOT NULL)")
+    try:
+        sql = "SELECT val FROM schema_change"
+        assert not collect_errors(conn, sql, int)
+        conn.run("ALTER TABLE schema_change ALTER COLUMN val TYPE text")
+        assert collect_errors(conn, sql, int)
+    finally:
+        conn.run("DROP TABLE schema_change")
+
+
 def test_unsupported_type_raises(conn):
     with pytest.raises(UnsupportedTypeError):
         collect_errors(
@@ -646,6 +664,17 @@ def test_sync_execute(dbapi_conn):
     )
 
 
+def test_sync_execute_many(dbapi_conn):
+    client = SyncClient(dbapi_conn)
+    client.execute_many(
+        "INSERT INTO cards (front, back) VALUES (%s, %s)",
+        [("many_1", "a"), ("many_2", "b")],
+    )
+    assert client.execute_rows(
+        "DELETE FROM cards WHERE front LIKE %s", "many_%"
+    ) == 2
+
+
 def test_sync_execute_rows(dbapi_conn):
     client = SyncClient(dbapi_conn)
     client.execute(
@@ -725,6 +754,52 @@ def test_query_fetch_all_sync(dbapi_conn):
     assert len(cards) == 3
 
 
+def test_query_fetch_all_sync_column_order(dbapi_conn):
+    @dataclass
+    class Row:
+        back: str
+        front: str
+        id: int = field(kw_only=True)
+
+    query = Query("SELECT id, front, back FROM cards ORDER BY id", Row)
+    assert query.fetch_all_sync(dbapi_conn)[0] == Row("hello", "bonjour", id=1)
+
+
+def test_query_fetch_all_sync_field_defaults(dbapi_conn):
+    @dataclass
+    class Row:
+        id: int
+        notes: str | None = None
+
+    query = Query("SELECT id FROM cards ORDER BY id", Row)
+    assert query.fetch_all_sync(dbapi_conn)[0] == Row(id=1)
+
+
+def test_query_fetch_all_sync_custom_init(dbapi_conn):
+    @dataclass(init=False)
+    class Row:
+        id: int
+        front: str
+
+        def __init__(self, front, id):  # noqa: A002
+            self.id = id
+            self.front = front
+
+    query = Query("SELECT id, front FROM cards ORDER BY id", Row)
+    row = query.fetch_all_sync(dbapi_conn)[0]
+    assert (row.id, row.front) == (1, "bonjour")
+
+
+def test_query_fetch_all_sync_pydantic_dataclass(dbapi_conn):
+    @pydantic_dataclass
+    class Row:
+        id: int
+        front: str
+
+    query = Query("SELECT id, front FROM cards ORDER BY id", Row)
+    assert query.fetch_all_sync(dbapi_conn)[0] == Row(id=1, front="bonjour")
+
+
 def test_execute_sync(dbapi_conn):
     exe = Execute(
         "INSERT INTO cards (front, back) VALUES (%s, %s)",
@@ -799,6 +874,44 @@ async def test_async_fetch_all(asyncpg_pool):
     assert cards[0] == Card(id=1, front="bonjour", back="hello")
 
 
+@pytest.mark.asyncio
+async def test_async_fetch_all_empty(asyncpg_pool):
+    client = AsyncClient(asyncpg_pool)
+    cards = await client.fetch_all(
+        "SELECT id, front, back FROM cards WHERE id = $1",
+        Card,
+        9999,
+    )
+    assert cards == []
+
+
+@pytest.mark.asyncio
+async def test_async_fetch_iter(asyncpg_pool):
+    client = AsyncClient(asyncpg_pool)
+    cards = [
+        card
+        async for card in client.fetch_iter(
+            "SELECT id, front, back FROM cards ORDER BY id",
+            Card,
+            prefetch=2,
+        )
+    ]
+    assert len(cards) == 3
+    assert cards[0] == Card(id=1, front="bonjour", back="hello")
+
+
+@pytest.mark.asyncio
+async def test_query_fetch_iter_connection(asyncpg_conn):
+    query = Query("SELECT id FROM cards WHERE id <= $1 ORDER BY id", int, 2)
+    assert [i async for i in query.fetch_iter(asyncpg_conn)] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_query_fetch_iter_psycopg(psycopg_conn):
+    query = Query("SELECT id FROM cards WHERE id <= %s ORDER BY id", int, 2)
+    assert [i async for i in query.fetch_iter(psycopg_conn)] == [1, 2]
+
+
 @pytest.mark.asyncio
 async def test_async_execute(asyncpg_pool):
     client = AsyncClient(asyncpg_pool)
@@ -813,6 +926,27 @@ async def test_async_execute(asyncpg_pool):
     )
 
 
+@pytest.mark.asyncio
+async def test_async_execute_many(asyncpg_pool, psycopg_conn):
+    client = AsyncClient(asyncpg_pool)
+    await client.execute_many(
+        "INSERT INTO cards (front, back) VALUES ($1, $2)",
+        [("many_1", "a"), ("many_2", "b")],
+    )
+    assert await client.execute_rows(
+        "DELETE FROM cards WHERE front LIKE $1", "many_%"
+    ) == 2
+
+    client = AsyncClient(psycopg_conn)
+    await client.execute_many(
+        "INSERT INTO cards (front, back) VALUES (%s, %s)",
+        [("many_3", "c")],
+    )
+    assert await client.execute_rows(
+        "DELETE FROM cards WHERE front LIKE %s", "many_%"
+    ) == 1
+
+
 @pytest.mark.asyncio
 async def test_async_execute_rows(asyncpg_pool):
     client = AsyncClient(asyncpg_pool)
@@ -839,6 +973,17 @@ async def test_query_fetch_one_async(asyncpg_pool):
     assert card == Card(id=1, front="bonjour", back="hello")
 
 
+@pytest.mark.asyncio
+async def test_query_fetch_one_async_no_rows(asyncpg_pool):
+    query = Query(
+        "SELECT id, front, back FROM cards WHERE id = $1",
+        Card,
+        9999,
+    )
+    with pytest.raises(RowNotFoundError):
+        await query.fetch_one(asyncpg_pool)
+
+
 @pytest.mark.asyncio
 async def test_query_fetch_optional_async(asyncpg_pool):
     query = Query(
@@ -897,6 +1042,45 @@ async def test_query_fetch_all_async(asyncpg_pool):
     assert len(cards) == 3
 
 
+@pytest.mark.asyncio
+async def test_query_fetch_all_async_column_order(asyncpg_pool):
+    query = Query("SELECT back, front, id FROM cards ORDER BY id", Card)
+    cards = await query.fetch_all(asyncpg_pool)
+    assert cards[0] == Card(id=1, front="bonjour", back="hello")
+
+
+@pytest.mark.asyncio
+async def test_query_fetch_all_async_kw_only(asyncpg_pool):
+    @dataclass(kw_only=True)
+    class Row:
+        id: int
+        front: str
+
+    query = Query("SELECT front, id FROM cards ORDER BY id", Row)
+    assert (await query.fetch_all(asyncpg_pool))[0] == Row(id=1, front="bonjour")
+
+
+@pytest.mark.asyncio
+async def test_query_fetch_all_async_field_defaults(asyncpg_pool):
+    @dataclass
+    class Row:
+        id: int
+        notes: str | None = None
+
+    query = Query("SELECT id FROM cards ORDER BY id", Row)
+    assert (await query.fetch_all(asyncpg_pool))[0] == Row(id=1)
+
+
+@pytest.mark.asyncio
+async def test_query_fetch_one_async_basemodel_override(asyncpg_pool):
+    class Row(BaseModel):
+        id: int
+        front: str
+
+    query = Query('SELECT id AS "id!", front FROM cards WHERE id = $1', Row, 1)
+    assert await query.fetch_one(asyncpg_pool) == Row(id=1, front="bonjour")
+
+
 @pytest.mark.asyncio
 async def test_execute_async(asyncpg_pool):
     exe = Execute(
@@ -986,6 +1170,158 @@ def test_validate_with_url():
     fear.validate_all(DB_URL)
 
 
+def test_validate_with_url_reuse(monkeypatch):
+    fear = FearOfSQL()
+
+    @fear.query
+    def list_cards() -> Query[Card]:
+        return Query("SELECT id, front, back FROM cards ORDER BY id", Card)
+
+    opened = []
+
+    def counting_connect(url):
+        opened.append(url)
+        return _connect_from_url(url)
+
+    monkeypatch.setattr(
+        "fear_of_sql._validate._connect_from_url", counting_connect
+    )
+    assert fear.validate_all(DB_URL, reuse=True) == 1
+    assert fear.validate_all(DB_URL, reuse=True) == 1
+    assert opened == [DB_URL]
+
+    fear.close_connections()
+    fear.close_connections()
+    assert fear.validate_all(DB_URL, reuse=True) == 1
+    assert opened == [DB_URL, DB_URL]
+    fear.close_connections()
+
+
+def test_validate_reuse_needs_url(conn):
+    with pytest.raises(TypeError, match="connection URL"):
+        FearOfSQL().validate_all(conn, reuse=True)
+
+
+def test_import_skips_async_drivers():
+    code = (
+        "import sys, fear_of_sql; "
+        "print(sorted({'asyncpg', 'psycopg', 'sqlalchemy'} & set(sys.modules)))"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_validate_parallel(caplog):
+    fear = FearOfSQL()
+
+    @fear.query
+    def list_cards() -> Query[Card]:
+        return Query("SELECT id, front, back FROM cards ORDER BY id", Card)
+
+    @fear.query
+    def bad_query() -> Query[Card]:
+        return Query("SELECT id FROM cards", Card)
+
+    @fear.query
+    def count_cards() -> Query[int]:
+        return Query('SELECT count(*) AS "count!" FROM cards', int)
+
+    with (
+        caplog.at_level(logging.INFO, logger="fear_of_sql"),
+        pytest.raises(ValidationError) as exc_info,
+    ):
+        fear.validate_all(DB_URL, max_workers=3)
+
+    assert exc_info.value.query_name == "bad_query"
+    assert [r.levelno for r in caplog.records] == [logging.INFO, logging.WARNING]
+
+    passing = FearOfSQL()
+    passing.query(list_cards)
+    passing.query(count_cards)
+    assert passing.validate_all(DB_URL, reuse=True, max_workers=2) == 2
+    passing.close_connections()
+
+
+def test_validate_parallel_needs_url(conn):
+    with pytest.raises(TypeError, match="connection URL"):
+        FearOfSQL().validate_all(conn, max_workers=2)
+
+
+def test_validate_cache(conn, tmp_path, monkeypatch):
+    cache_path = tmp_path / "validated.json"
+    fear = FearOfSQL(cache_path=cache_path)
+
+    @fear.query
+    def list_cards() -> Query[Card]:
+        return Query("SELECT id, front, back FROM cards ORDER BY id", Card)
+
+    @fear.query
+    def delete(card_id: int) -> Execute:
+        return Execute("DELETE FROM cards WHERE id = $1", card_id)
+
+    assert fear.validate_all(conn) == 2
+    assert len(json.loads(cache_path.read_text())["validated"]) == 2
+
+    def fail(*_args):
+        raise AssertionError
+
+    monkeypatch.setattr("fear_of_sql._validate._collect_errors", fail)
+    assert fear.validate_all(conn) == 2
+
+    conn.run("CREATE TEMP TABLE validate_cache_test (val int4)")
+    with pytest.raises(AssertionError):
+        fear.validate_all(conn)
+    assert json.loads(cache_path.read_text())["validated"] == []
+    conn.run("DROP TABLE validate_cache_test")
+
+    monkeypatch.undo()
+    assert fear.validate_all(conn) == 2
+    monkeypatch.setattr("fear_of_sql._validate._collect_errors", fail)
+    conn.run(
+        "CREATE FUNCTION validate_cache_fn() RETURNS int "
+        "LANGUAGE sql AS 'SELECT 1'"
+    )
+    try:
+        with pytest.raises(AssertionError):
+            fear.validate_all(conn)
+    finally:
+        conn.run("DROP FUNCTION validate_cache_fn()")
+
+
+def test_validate_cache_skips_failures(conn, tmp_path):
+    cache_path = tmp_path / "validated.json"
+    fear = FearOfSQL(cache_path=cache_path)
+
+    @fear.query
+    def bad_query() -> Query[Card]:
+        return Query("SELECT id FROM cards", Card)
+
+    with pytest.raises(ValidationError):
+        fear.validate_all(conn)
+    data = json.loads(cache_path.read_text())
+    assert data["validated"] == []
+    assert data["schema"].startswith(version("fear-of-sql") + ":")
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["not json", "[]", '"validated"', '{"validated": []}', '{"schema": "x"}'],
+)
+def test_validate_cache_unreadable(conn, tmp_path, content):
+    cache_path = tmp_path / "validated.json"
+    cache_path.write_text(content)
+    fear = FearOfSQL(cache_path=str(cache_path))
+
+    @fear.query
+    def one() -> Query[int]:
+        return Query('SELECT 1 AS "one!"', int)
+
+    assert fear.validate_all(conn) == 1
+    assert len(json.loads(cache_path.read_text())["validated"]) == 1
+
+
 def test_validate_list_param(conn):
     fear = FearOfSQL()
 
@@ -1052,6 +1388,23 @@ def test_validate_optional_typing(conn):
     fear.validate_all(conn)
 
 
+def test_validate_union_param(conn):
+    fear = FearOfSQL()
+
+    @fear.query
+    def search(limit: set[int] | int) -> Query[int]:
+        return Query("SELECT id FROM cards LIMIT $1", int, limit)
+
+    assert fear.validate_all(conn) == 1
+
+    @fear.query
+    def bad(x: complex | bytearray) -> Query[int]:
+        return Query("SELECT $1", int, x)
+
+    with pytest.raises(TypeError, match="no dummy value"):
+        fear.validate_all(conn)
+
+
 def test_validate_logs_success(caplog, conn):
     fear = FearOfSQL()
 
@@ -1115,6 +1468,68 @@ async def test_asyncpg_executor(asyncpg_pool):
     assert await exe2.execute_rows(asyncpg_pool) == 1
 
 
+@pytest.mark.asyncio
+async def test_asyncpg_connection_executor(asyncpg_conn):
+    q = Query("SELECT id, front, back FROM cards WHERE id = $1", Card, 1)
+    assert await q.fetch_one(asyncpg_conn) == await q.fetch_one(asyncpg_conn)
+    assert await q.fetch_optional(asyncpg_conn) == Card(
+        id=1, front="bonjour", back="hello"
+    )
+    ids = Query("SELECT id FROM cards WHERE id <= 3 ORDER BY id", int)
+    assert await ids.fetch_all(asyncpg_conn) == [1, 2, 3]
+
+    await Execute(
+        "INSERT INTO cards (front, back) VALUES ($1, $2)", "asyncpg_conn", "bye"
+    ).execute(asyncpg_conn)
+    exe = Execute("DELETE FROM cards WHERE front = $1", "asyncpg_conn")
+    assert await exe.execute_rows(asyncpg_conn) == 1
+    assert await exe.execute_rows(asyncpg_conn) == 0
+
+
+class _AsyncpgConnectionSubclass(asyncpg.Connection):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_asyncpg_connection_subclass_executor():
+    conn = await asyncpg.connect(
+        DB_URL, connection_class=_AsyncpgConnectionSubclass
+    )
+    try:
+        q = Query("SELECT 1 AS val", int)
+        assert await q.fetch_one(conn) == 1
+        assert await q.fetch_one(conn) == 1
+    finally:
+        await conn.close()
+
+
+@pytest.mark.asyncio
+async def test_asyncpg_connection_execute_multiple_statements(asyncpg_conn):
+    await Execute(
+        "CREATE TEMP TABLE multi_test (val int4); "
+        "INSERT INTO multi_test VALUES (1)"
+    ).execute(asyncpg_conn)
+    assert await Query("SELECT val FROM multi_test", int).fetch_all(
+        asyncpg_conn
+    ) == [1]
+
+
+@pytest.mark.asyncio
+async def test_query_unprepared(asyncpg_pool, asyncpg_conn, psycopg_conn):
+    query = Query(
+        "SELECT id, front, back FROM cards WHERE id = $1", Card, 1, prepare=False
+    )
+    for executor in (asyncpg_pool, asyncpg_conn):
+        assert (await query.fetch_one(executor)).front == "bonjour"
+        assert [c.id for c in await query.fetch_all(executor)] == [1]
+
+    query = Query(
+        "SELECT id, front, back FROM cards WHERE id = %s", Card, 1, prepare=False
+    )
+    assert (await query.fetch_optional(psycopg_conn)).front == "bonjour"
+    assert [c.id for c in await query.fetch_all(psycopg_conn)] == [1]
+
+
 @pytest.mark.asyncio
 async def test_psycopg_executor(psycopg_conn):
     fear = FearOfSQL()
@@ -1152,6 +1567,16 @@ async def test_sqlalchemy_async_session(sa_async_session):
     assert card == Card(id=1, front="bonjour", back="hello")
 
 
+@pytest.mark.asyncio
+async def test_sqlalchemy_async_session_client(sa_async_session):
+    client = AsyncClient(sa_async_session)
+    card = await client.fetch_one(
+        "SELECT id, front, back FROM cards WHERE id = $1", Card, 1
+    )
+    assert card == Card(id=1, front="bonjour", back="hello")
+    assert await client.fetch_all("SELECT id FROM cards WHERE id = $1", int, 1) == [1]
+
+
 @pytest.mark.asyncio
 async def test_sqlalchemy_async_session_fetch_optional(sa_async_session):
     query = Query(
@@ -1519,12 +1944,15 @@ async def test_scalar_fetch_optional_async(asyncpg_pool, sql, result_type, expec
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize(
-    ("sql", "result_type", "expected"),
-    [
+async def test_scalar_fetch_all_async(asyncpg_pool):
+    cases = [
         ("SELECT 1 AS val", int, [1]),
         ("SELECT 'hello' AS val", str, ["hello"]),
-    ],
-)
-async def test_scalar_fetch_all_async(asyncpg_pool, sql, result_type, expected):
-    assert await Query(sql, result_type).fetch_all(asyncpg_pool) == expected
+    ]
+    results = await asyncio.gather(
+        *(
+            Query(sql, result_type).fetch_all(asyncpg_pool)
+            for sql, result_type, _ in cases
+        )
+    )
+    assert results == [expected for *_, expected in cases]
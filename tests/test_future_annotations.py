@@ -1,6 +1,17 @@
 from __future__ import annotations
 
-from fear_of_sql import FearOfSQL, Query
+from dataclasses import dataclass
+
+import pytest
+
+from fear_of_sql import FearOfSQL, Query, collect_errors
+
+
+@dataclass
+class Review:
+    id: int
+    card_id: int
+    score: int | None
 
 
 def test_validate_with_future_annotations(conn):
@@ -11,3 +22,25 @@ def test_validate_with_future_annotations(conn):
         return Query("SELECT id FROM cards WHERE id = $1", int, card_id)
 
     fear.validate_all(conn)
+
+
+def test_dataclass_with_future_annotations(conn):
+    errors = collect_errors(
+        conn,
+        "SELECT r.id, r.card_id, r.score FROM reviews r",
+        Review,
+    )
+    assert errors == []
+
+
+def test_dataclass_with_unresolvable_annotation(conn):
+    class Score(int):
+        pass
+
+    @dataclass
+    class Row:
+        id: int
+        score: Score | None
+
+    with pytest.raises(TypeError, match=r"Row\.score: cannot resolve"):
+        collect_errors(conn, "SELECT r.id, r.score FROM reviews r", Row)
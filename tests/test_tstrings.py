@@ -1,5 +1,9 @@
+from string.templatelib import Interpolation, Template
+
+import pytest
+
 from fear_of_sql import (
-    collect_errors, Execute, Query
+    AsyncClient, collect_errors, Execute, Query
 )
 
 
@@ -29,3 +33,22 @@ def test_execute_tstring():
     e = Execute(t"INSERT INTO cards (front, back) VALUES ({'hi'}, {'bye'})")
     assert e.sql == "INSERT INTO cards (front, back) VALUES ($1, $2)"
     assert e.args == ("hi", "bye")
+
+
+def test_query_tstring_many_params():
+    q = Query(Template(*(Interpolation(i, "i") for i in range(70))), int)
+    assert q.sql == "".join(f"${i}" for i in range(1, 71))
+    assert q.args == tuple(range(70))
+
+
+@pytest.mark.asyncio
+async def test_async_client_tstring(asyncpg_pool):
+    client = AsyncClient(asyncpg_pool)
+    card_id = 1
+    query = t"SELECT front FROM cards WHERE id = {card_id}"
+    assert await client.fetch_one(query, str) == "bonjour"
+    assert await client.fetch_optional(query, str) == "bonjour"
+    assert await client.fetch_all(query, str) == ["bonjour"]
+    update = t"UPDATE cards SET front = front WHERE id = {card_id}"
+    await client.execute(update)
+    assert await client.execute_rows(update) == 1